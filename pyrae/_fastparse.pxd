@@ -0,0 +1,6 @@
+cimport cython
+
+
+@cython.locals(cell_index=Py_ssize_t, type_key=str, sub_type_key=str, sub_type_keys_dict=dict, persona=str,
+               cell_name=str, cell_text=str, keys=list, split_verbs=list)
+cpdef fill_conjugations(dict conjugations, list rows, dict sub_type_res, object verb_separators_re)
@@ -0,0 +1,45 @@
+from pyrae.util import nested_dictionary_set
+from typing import Pattern, Sequence, Tuple
+
+
+def fill_conjugations(conjugations: dict,
+                      rows: Sequence[Tuple[str, Sequence[Tuple[str, str]]]],
+                      sub_type_res: dict,
+                      verb_separators_re: Pattern):
+    """ Fills the conjugations of a verb from the rows of its conjugations table, already converted to text.
+
+    Works on plain strings only, so the loop runs without touching parsed tags. The types in _fastparse.pxd are used
+    when the module is compiled with Cython.
+
+    :param conjugations: The dictionary with the empty structure of the conjugations, filled in place.
+    :param rows: The rows of the table, each one a tuple with the persona of the row and a sequence of tuples with the
+                 name and the text of each conjugation cell.
+    :param sub_type_res: Patterns that identify the sub type of a conjugation from the text of a header, grouped by
+                         type.
+    :param verb_separators_re: The pattern that separates alternative forms of a verb.
+    """
+    type_key = ''
+    sub_type_keys_dict = {}
+    for persona, cells in rows:
+        for cell_index, (cell_name, cell_text) in enumerate(cells):
+            if cell_name == 'th':
+                if cell_text in conjugations:
+                    type_key = cell_text
+                    sub_type_keys_dict = {}
+                    continue
+                sub_type_key = ''
+                for key, sub_type_re in sub_type_res[type_key].items():
+                    if sub_type_re.search(string=cell_text):
+                        sub_type_key = key
+                        break
+                sub_type_keys_dict[cell_index] = sub_type_key
+            elif cell_name == 'td':
+                keys = [type_key]
+                if sub_type_keys_dict:
+                    keys.append(sub_type_keys_dict[cell_index])
+                verbs = cell_text
+                split_verbs = verb_separators_re.split(string=verbs)
+                if len(split_verbs) > 1:
+                    verbs = split_verbs
+                data_value = {persona: verbs} if persona else verbs
+                nested_dictionary_set(dictionary=conjugations, keys=keys, value=data_value)
@@ -0,0 +1,13 @@
+cimport cython
+
+
+@cython.locals(components=list, pieces=list, name=str)
+cpdef tuple _parse_sentence(object root_tag, frozenset ignore_tags, tuple word_tags)
+
+
+@cython.locals(index=Py_ssize_t, first_of_category=bint, abbreviations=list, examples=list, name=str, tag_class=str)
+cpdef tuple _parse_definition(object p_tag, object index_re)
+
+
+@cython.locals(supplementary_info=list, definitions=list, name=str, class_letter=str)
+cpdef tuple _process_entry_tags(object tags, object lema_class, object processing_tags)
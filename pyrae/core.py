@@ -1,10 +1,15 @@
+import importlib.util
 import re
 from abc import ABC, abstractmethod
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from bs4.element import Tag
-from copy import deepcopy
-from pyrae.util import nested_dictionary_set
-from typing import List, Optional, Sequence, Union
+from functools import lru_cache
+from pyrae._fastparse import fill_conjugations
+from types import MappingProxyType
+from typing import FrozenSet, List, Mapping, Match, Optional, Pattern, Sequence, Tuple, Union
+
+# The faster lxml parser is used when installed, the built-in parser otherwise.
+HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
 
 DLE_MAIN_URL = 'https://dle.rae.es'
 
@@ -12,22 +17,37 @@ DLE_MAIN_URL = 'https://dle.rae.es'
 class FromHTML(ABC):
     """ Represents an entity that can parse HTML text.
     """
-    def __init__(self, html: str):
+    __slots__ = ('_html', '_parsed', '_raw_text', '_soup')
+    # Restricts parsing of the HTML text to the tags of interest, None to parse everything.
+    _PARSE_ONLY: Optional[SoupStrainer] = None
+
+    def __init__(self, html: str = '',
+                 tag: Optional[Tag] = None):
         """ Initializes a new instance of the FromHTML class.
 
         :param html: HTML text.
+        :param tag: An already parsed tag, used instead of the HTML text to avoid parsing it again.
         """
         self._parsed: bool = False
         self._raw_text: str = ''
-        self._soup: Optional[BeautifulSoup] = None
-        self.html = html
+        self._soup: Optional[Tag] = None
+        if tag is not None:
+            self._html: Optional[str] = None
+            self._soup = tag
+            self._parse_html()
+        else:
+            self.html = html
 
     def __getstate__(self) -> dict:
         """ Gets a dictionary with attributes that are pickable.
 
         :return: A dictionary with attributes that are pickable.
         """
-        state = self.__dict__.copy()
+        state = {name: getattr(self, name)
+                 for cls in type(self).__mro__ for name in getattr(cls, '__slots__', ())
+                 if hasattr(self, name)}
+        # The HTML of instances created from a tag is only rendered on demand, so make sure it is kept.
+        state['_html'] = self.html
         # Remove the unpickable entries.
         if '_soup' in state:
             del state['_soup']
@@ -38,14 +58,17 @@ class FromHTML(ABC):
 
         :param state: A saved instance state.
         """
-        self.__dict__.update(state)
-        self._soup: Optional[BeautifulSoup] = None
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._soup: Optional[Tag] = None
         self._parse_html()
 
     @property
     def html(self) -> str:
         """ Gets the HTML text used for parsing.
         """
+        if self._html is None:
+            self._html = self._render_html()
         return self._html
 
     @html.setter
@@ -55,6 +78,7 @@ class FromHTML(ABC):
         :param value: The HTML text used for parsing.
         """
         self._html = value
+        self._soup = None
         self._parsed = False
         self._parse_html()
 
@@ -67,6 +91,15 @@ class FromHTML(ABC):
         except Exception:
             return None
 
+    @classmethod
+    def from_tag(cls, tag: Tag):
+        """ Creates an instance from an already parsed tag if parsed successfully.
+        """
+        try:
+            return cls(tag=tag)
+        except Exception:
+            return None
+
     @abstractmethod
     def to_dict(self, extended: bool = False) -> dict:
         """ Gets a dictionary representation of this instance.
@@ -74,21 +107,54 @@ class FromHTML(ABC):
         :param extended: Flag indicating whether extended or basic information is output in the dictionary.
         """
         return {
-            'html': self._html
+            'html': self.html
         } if extended else {}
 
     @abstractmethod
     def _parse_html(self):
         """ Parses the contents of the HTML.
         """
+        if self._soup is not None:
+            # Already parsed, or an instance created from a tag.
+            if not isinstance(self._soup, Tag):
+                raise Exception('Invalid tag.')
+            return
         if not self._html:
             raise Exception('No HTML has been set.')
         if not re.search(pattern='<[^>]*>', string=str(self._html)):
             raise Exception('No HTML text to parse.')
-        self._soup = BeautifulSoup(self._html, 'html.parser')
+        self._soup = BeautifulSoup(self._html, HTML_PARSER, parse_only=self._PARSE_ONLY)
         if not self._soup:
             raise Exception('Invalid HTML.')
 
+    def _render_html(self) -> str:
+        """ Renders the HTML text of an instance created from already parsed tags.
+
+        :return: The HTML text.
+        """
+        return str(self._soup)
+
+    def _root_tag(self) -> Optional[Tag]:
+        """ Gets the root tag of the parsed HTML, skipping the <html> and <body> elements some parsers wrap
+        HTML fragments with.
+
+        :return: The root tag, or None if the parsed HTML does not contain any tag.
+        """
+        if not isinstance(self._soup, BeautifulSoup):
+            return self._soup
+        container = self._soup.body or self._soup
+        return container.find(True, recursive=False)
+
+    def _find_tag(self, name: str) -> Optional[Tag]:
+        """ Finds the first tag with the given name, the root of an instance created from a tag included.
+
+        :param name: The name of the tag.
+        :return: The first tag found, or None if there is no tag with the given name.
+        """
+        if self._soup.name == name:
+            return self._soup
+        return self._soup.find(name=name)
+
     @abstractmethod
     def _reset(self):
         """ Resets fields to a clean state. Needed when resetting the HTML text.
@@ -99,12 +165,17 @@ class FromHTML(ABC):
 class Abbr(FromHTML):
     """ Represents an abbreviation.
     """
-    def __init__(self, html: str):
+    __slots__ = ('_abbr', '_class', '_text')
+    _PARSE_ONLY = SoupStrainer(name='abbr')
+
+    def __init__(self, html: str = '',
+                 tag: Optional[Tag] = None):
         """ Initializes a new instance of the Abbr class.
 
         :param html: HTML code that represents an abbreviation.
+        :param tag: An already parsed tag that represents an abbreviation.
         """
-        super().__init__(html=html)
+        super().__init__(html=html, tag=tag)
 
     def __repr__(self):
         """ Gets the string representation of the object instance.
@@ -157,14 +228,17 @@ class Abbr(FromHTML):
         if self._parsed:
             return
         self._reset()
-        if not self._soup.abbr:
+        abbr_tag = self._find_tag(name='abbr')
+        if not abbr_tag:
             raise Exception('Invalid HTML.')
-        self._abbr = self._soup.abbr.text
-        if self._soup.abbr.has_attr('class'):
-            self._class = self._soup.abbr['class'][0]
-        if not self._soup.abbr.has_attr('title'):
+        self._abbr = abbr_tag.text
+        classes = abbr_tag.attrs.get('class')
+        if classes:
+            self._class = classes[0]
+        title = abbr_tag.attrs.get('title')
+        if title is None:
             raise Exception('The title attribute is expected to contain the expanded text.')
-        self._text = self._soup.abbr['title']
+        self._text = title
         self._parsed = True
 
     def _reset(self):
@@ -178,15 +252,19 @@ class Abbr(FromHTML):
 class Word(FromHTML):
     """ A single word with a corresponding ID in the RAE dictionary.
     """
-    def __init__(self, html: str,
-                 parent_href: str = ''):
+    __slots__ = ('_href', '_is_active_link', '_parent_href', '_text')
+
+    def __init__(self, html: str = '',
+                 parent_href: str = '',
+                 tag: Optional[Tag] = None):
         """ Initialize a new instance of the Word class.
 
         :param html: HTML code that represents a single word.
         :param parent_href: An optional HREF to complement the link if needed.
+        :param tag: An already parsed tag that represents a single word.
         """
         self._parent_href: str = parent_href
-        super().__init__(html=html)
+        super().__init__(html=html, tag=tag)
 
     def __repr__(self):
         """ Gets the string representation of the object instance.
@@ -194,7 +272,7 @@ class Word(FromHTML):
         :return: The string representation of the object instance.
         """
         return f'Word(text="{self._text}", active_link={self._is_active_link}, ' \
-               f'html="{self._html}")'
+               f'html="{self.html}")'
 
     def __str__(self):
         """ Gets the string representation of the object instance.
@@ -252,19 +330,23 @@ class Word(FromHTML):
         if self._parsed:
             return
         self._reset()
-        if self._soup.mark:
-            self._href = f"/?id={self._soup.mark['data-id']}"
-            self._text = self._soup.mark.text
-        elif self._soup.a:
-            self._text = self._soup.a.text.strip()
-            self._href = self._soup.a['href']
+        mark_tag = self._find_tag(name='mark')
+        a_tag = self._find_tag(name='a') if not mark_tag else None
+        span_tag = self._find_tag(name='span') if not mark_tag and not a_tag else None
+        if mark_tag:
+            self._href = f"/?id={mark_tag['data-id']}"
+            self._text = mark_tag.text
+        elif a_tag:
+            self._text = a_tag.text.strip()
+            self._href = a_tag['href']
             if self._href and not self._href.startswith('/'):
                 self._href = f'/{self._parent_href}{self._href}'
             self._is_active_link = True
-        elif (self._soup.span
-              and (self._soup.span['class'][0].lower() == 'u'
-                   or 'data-id' in self._soup.span.attrs)):
-            self._text = self._soup.span.text
+        elif span_tag:
+            classes = span_tag.attrs.get('class')
+            if not ((classes and classes[0].lower() == 'u') or 'data-id' in span_tag.attrs):
+                raise Exception('The HTML code cannot be parsed to a Word.')
+            self._text = span_tag.text
         else:
             raise Exception('The HTML code cannot be parsed to a Word.')
         self._parsed = True
@@ -277,18 +359,58 @@ class Word(FromHTML):
         self._is_active_link: bool = False
 
 
+def _parse_sentence(root_tag: Tag,
+                    ignore_tags: FrozenSet[str],
+                    word_tags: Tuple[str, ...]) -> Tuple[List[Union[Abbr, Word, str]], str]:
+    """ Parses the components of a sentence from the children of its root tag. Kept out of the Sentence class so that
+    the C types declared in core.pxd apply when the module is compiled with Cython.
+
+    :param root_tag: The root tag of the sentence.
+    :param ignore_tags: The names of the tags that are not part of the sentence.
+    :param word_tags: The names of the tags that can be parsed to a Word.
+    :return: A tuple with the components of the sentence and its text.
+    """
+    components = []
+    pieces = []
+    for tag in root_tag.children:
+        name = tag.name
+        if name in ignore_tags:
+            continue
+        if name == 'span' and 'data-id' not in tag.attrs:
+            continue
+        if name == 'abbr':
+            component = Abbr.from_tag(tag=tag)
+        elif name in word_tags:
+            component = Word.from_tag(tag=tag)
+        else:
+            component = None
+        if component:
+            piece = str(component)
+        else:
+            component = piece = tag.get_text() if isinstance(tag, Tag) else str(tag)
+        components.append(component)
+        pieces.append(piece)
+    return components, ''.join(pieces).strip()
+
+
 class Sentence(FromHTML):
     """ A sentence made up of strings and instances of the Word class.
     """
-    def __init__(self, html: str,
-                 ignore_tags: Sequence[str] = ()):
+    __slots__ = ('_components', '_ignore_tags', '_text')
+    # Tags that can be parsed to a Word.
+    __WORD_TAGS = ('a', 'mark', 'span')
+
+    def __init__(self, html: str = '',
+                 ignore_tags: Sequence[str] = (),
+                 tag: Optional[Tag] = None):
         """ Initializes a new instance of the Sentence class.
 
         :param html: HTML code that can be parsed into a sentence.
         :param ignore_tags: A sequence of tags to be ignored while parsing the sentence.
+        :param tag: An already parsed tag that can be parsed into a sentence.
         """
-        self._ignore_tags: Sequence[str] = ignore_tags
-        super().__init__(html=html)
+        self._ignore_tags: FrozenSet[str] = frozenset(ignore_tags)
+        super().__init__(html=html, tag=tag)
 
     def __repr__(self):
         """ Gets the string representation of the object instance.
@@ -330,7 +452,7 @@ class Sentence(FromHTML):
     def text(self) -> str:
         """ Gets the text of the sentence.
         """
-        return ''.join([str(component) for component in self._components]).strip()
+        return self._text
 
     def to_dict(self, extended: bool = False) -> dict:
         """ Gets a dictionary representation of this instance.
@@ -352,57 +474,95 @@ class Sentence(FromHTML):
         if self._parsed:
             return
         self._reset()
-        for tag in self._soup.contents[0].children:
-            if tag.name in self._ignore_tags:
-                continue
-            if tag.name == 'span' and 'data-id' not in tag.attrs:
-                continue
-            abbr = Abbr.from_html(html=str(tag))
-            if abbr:
-                self._components.append(abbr)
-                continue
-            word = Word.from_html(html=str(tag))
-            if word:
-                self._components.append(word)
-                continue
-            self._components.append(tag.get_text() if isinstance(tag, Tag) else str(tag))
+        self._components, self._text = _parse_sentence(root_tag=self._root_tag(), ignore_tags=self._ignore_tags,
+                                                       word_tags=self.__WORD_TAGS)
         self._parsed = True
 
     def _reset(self):
         """ Resets fields to a clean state. Needed when resetting the HTML text.
         """
         self._components: List[Union[Abbr, Word, str]] = []
+        self._text: str = ''
+
+
+def _parse_definition(p_tag: Tag,
+                      index_re: Pattern) -> Tuple[int, Optional[Abbr], bool, List[Abbr], List[Sentence]]:
+    """ Parses the index, category, abbreviations and examples of a definition from the children of its paragraph.
+    Kept out of the Definition class so that the C types declared in core.pxd apply when the module is compiled with
+    Cython.
+
+    :param p_tag: The paragraph tag of the definition.
+    :param index_re: The pattern that matches the index of the definition.
+    :return: A tuple with the index, the category, whether the category is the first of its kind, the abbreviations
+             and the examples of the definition.
+    """
+    index = 0
+    category = None
+    first_of_category = False
+    abbreviations = []
+    examples = []
+    for tag in p_tag.find_all(True, recursive=False):
+        name = tag.name
+        classes = tag.attrs.get('class')
+        tag_class = classes[0].lower() if classes else ''
+        if name == 'span':
+            # noinspection SpellCheckingInspection
+            if tag_class == 'n_acep':
+                # The index
+                match = index_re.match(string=tag.text)
+                if match:
+                    index = int(match['index'])
+            elif tag_class == 'h':
+                # An example
+                examples.append(Sentence(tag=tag))
+        elif name == 'abbr':
+            if not category:
+                # The first abbr is the category
+                category = Abbr(tag=tag)
+                first_of_category = tag_class == 'd'
+            else:
+                # Another abbr to complement the main sentence of the definition
+                abbreviations.append(Abbr(tag=tag))
+    return index, category, first_of_category, abbreviations, examples
 
 
 class Definition(FromHTML):
     """ Represents a simple definition for a simple or complex form.
     """
-    __INDEX_REGEX_STRING = r'^(?P<index>\d+).\D*$'
+    __slots__ = ('_abbreviations', '_category', '_category_flags', '_examples', '_first_of_category', '_id', '_index',
+                 '_sentence')
+    __INDEX_REGEX_STRING = r'^(?P<index>\d+)\.\D*$'
     # noinspection SpellCheckingInspection
     __VERB_REGEX_STRING = r'^.*verbo.*$'
-    __index_re = re.compile(pattern=__INDEX_REGEX_STRING, flags=re.IGNORECASE)
+    # noinspection SpellCheckingInspection
+    __VERB_ABBRS = ('part.', 'ger.', 'pret.', 'fut.', 'pres.', 'infinit.')
+    __VERB_ABBR_REGEX_STRING = '|'.join(map(re.escape, __VERB_ABBRS))
+    __index_re = re.compile(pattern=__INDEX_REGEX_STRING)
     __verb_re = re.compile(pattern=__VERB_REGEX_STRING, flags=re.IGNORECASE)
+    __verb_abbr_re = re.compile(pattern=__VERB_ABBR_REGEX_STRING, flags=re.IGNORECASE)
 
-    def __init__(self, html: str):
+    def __init__(self, html: str = '',
+                 tag: Optional[Tag] = None):
         """ Initializes a new instance of the Definition class.
 
         :param html: HTML code that contains a definition.
+        :param tag: An already parsed tag that contains a definition.
         """
-        super().__init__(html=html)
+        super().__init__(html=html, tag=tag)
 
     def __repr__(self):
         """ Gets the string representation of the object instance.
 
         :return: The string representation of the object instance.
         """
-        return f'Definition(id="{self._id}", raw_text="{self._raw_text}")'
+        return f'Definition(id="{self._id}", raw_text="{self.raw_text}")'
 
     def __str__(self):
         """ Gets the string representation of the object instance.
 
         :return: The string representation of the object instance.
         """
-        return self._raw_text
+        return self.raw_text
 
     @property
     def abbreviations(self) -> Sequence[Abbr]:
@@ -444,46 +604,44 @@ class Definition(FromHTML):
     def is_adverb(self) -> bool:
         """ Gets a value indicating whether the category of the definition corresponds to an adverb.
         """
-        return self._category.abbr == 'adv.'
+        return self._get_category_flags()['adverb']
 
     @property
     def is_adjective(self) -> bool:
         """ Gets a value indicating whether the category of the definition corresponds to an adjective.
         """
-        return self._category.abbr == 'adj.'
+        return self._get_category_flags()['adjective']
 
     @property
     def is_interjection(self) -> bool:
         """ Gets a value indicating whether the category of the definition corresponds to an interjection.
         """
-        return self._category.abbr == 'interj.'
+        return self._get_category_flags()['interjection']
 
     @property
     def is_noun(self) -> bool:
         """ Gets a value indicating whether the category of the definition corresponds to a noun.
         """
-        # noinspection SpellCheckingInspection
-        return self._category.abbr in ('s.', 'sust.', 'm.', 'f.', 'm. y f.')
+        return self._get_category_flags()['noun']
 
     @property
     def is_pronoun(self) -> bool:
         """ Gets a value indicating whether the category of the definition corresponds to a pronoun.
         """
-        return self._category.abbr == 'pron.'
+        return self._get_category_flags()['pronoun']
 
     @property
     def is_verb(self) -> bool:
         """ Gets a value indicating whether the category of the definition corresponds to a verb.
         """
-        # noinspection SpellCheckingInspection
-        return (self.__verb_re.match(self._category.text) is not None
-                or re.search(pattern='|'.join(('part.', 'ger.', 'pret.', 'fut.', 'pres.', 'infinit.')),
-                             string=self._category.abbr) is not None)
+        return self._get_category_flags()['verb']
 
     @property
     def raw_text(self) -> str:
         """ Gets the raw text of the whole HTML used for the definition.
         """
+        if self._raw_text is None:
+            self._raw_text = self._soup.get_text()
         return self._raw_text
 
     @property
@@ -503,32 +661,48 @@ class Definition(FromHTML):
 
         :param extended: Flag indicating whether extended or basic information is output in the dictionary.
         """
+        if not extended:
+            return {
+                'index': self._index,
+                'category': self._category.to_dict(extended=extended),
+                'is': dict(self._get_category_flags()),
+                'abbreviations': [abbr.to_dict(extended=extended) for abbr in self._abbreviations],
+                'sentence': self._sentence.to_dict(extended=extended),
+                'examples': [ex.to_dict(extended=extended) for ex in self._examples]
+            }
         res_dict = super().to_dict(extended=extended)
-        if extended:
-            res_dict['id'] = self._id
         res_dict.update({
+            'id': self._id,
             'index': self._index,
             'category': self._category.to_dict(extended=extended),
-            'is': {
-                'adjective': self.is_adjective,
-                'adverb': self.is_adverb,
-                'interjection': self.is_interjection,
-                'noun': self.is_noun,
-                'pronoun': self.is_pronoun,
-                'verb': self.is_verb
-            }
-        })
-        if extended:
-            res_dict['first_of_category'] = self._first_of_category
-        res_dict.update({
+            'is': dict(self._get_category_flags()),
+            'first_of_category': self._first_of_category,
             'abbreviations': [abbr.to_dict(extended=extended) for abbr in self._abbreviations],
             'sentence': self._sentence.to_dict(extended=extended),
-            'examples': [ex.to_dict(extended=extended) for ex in self._examples]
+            'examples': [ex.to_dict(extended=extended) for ex in self._examples],
+            'raw_text': self.raw_text
         })
-        if extended:
-            res_dict['raw_text'] = self._raw_text
         return res_dict
 
+    def _get_category_flags(self) -> dict:
+        """ Gets the flags indicating the grammatical category of the definition, computed only once.
+
+        :return: A dictionary with a flag for each grammatical category.
+        """
+        if self._category_flags is None:
+            abbr = self._category.abbr
+            # noinspection SpellCheckingInspection
+            self._category_flags = {
+                'adjective': abbr == 'adj.',
+                'adverb': abbr == 'adv.',
+                'interjection': abbr == 'interj.',
+                'noun': abbr in ('s.', 'sust.', 'm.', 'f.', 'm. y f.'),
+                'pronoun': abbr == 'pron.',
+                'verb': (self.__verb_re.match(self._category.text) is not None
+                         or self.__verb_abbr_re.search(abbr) is not None)
+            }
+        return self._category_flags
+
     def _parse_html(self):
         """ Parses the contents of the HTML.
         """
@@ -536,36 +710,16 @@ class Definition(FromHTML):
         if self._parsed:
             return
         self._reset()
-        if not self._soup.p or not self._soup.p.has_attr('class'):
+        p_tag = self._find_tag(name='p')
+        p_classes = p_tag.attrs.get('class') if p_tag else None
+        if not p_classes:
             raise Exception('Invalid HTML tag passed for a definition.')
-        if self._soup.p['class'][0].lower()[0] not in ['j', 'm']:
+        if p_classes[0].lower()[0] not in ['j', 'm']:
             raise Exception('Paragraph class does not correspond to a definition.')
-        self._raw_text = self._soup.get_text()
-        if self._soup.p.has_attr('id'):
-            self._id = self._soup.p['id']
-        for tag in self._soup.p.children:
-            if not isinstance(tag, Tag):
-                continue
-            tag_class = tag['class'][0].lower() if tag.has_attr('class') else ''
-            if tag.name == 'span':
-                # noinspection SpellCheckingInspection
-                if tag_class == 'n_acep':
-                    # The index
-                    match = self.__index_re.match(string=tag.text)
-                    if match:
-                        self._index = int(match['index'])
-                elif tag_class == 'h':
-                    # An example
-                    self._examples.append(Sentence(html=str(tag)))
-            elif tag.name == 'abbr':
-                if not self._category:
-                    # The first abbr is the category
-                    self._category = Abbr(html=str(tag))
-                    self._first_of_category = tag_class == 'd'
-                else:
-                    # Another abbr to complement the main sentence of the definition
-                    self._abbreviations.append(Abbr(html=str(tag)))
-        self._sentence = Sentence(html=str(self._soup.p), ignore_tags=('abbr',))
+        self._id = p_tag.attrs.get('id', '')
+        (self._index, self._category, self._first_of_category, self._abbreviations,
+         self._examples) = _parse_definition(p_tag=p_tag, index_re=self.__index_re)
+        self._sentence = Sentence(ignore_tags=('abbr',), tag=p_tag)
         self._parsed = True
 
     def _reset(self):
@@ -574,29 +728,34 @@ class Definition(FromHTML):
         self._id: str = ''
         self._index: int = 0
         self._category: Optional[Abbr] = None
+        self._category_flags: Optional[dict] = None
         self._first_of_category: bool = False
         self._abbreviations: List[Abbr] = []
         self._sentence: Optional[Sentence] = None
         self._examples: List[Sentence] = []
-        self._raw_text: str = ''
+        self._raw_text: Optional[str] = None
 
 
 class EntryLema(FromHTML):
     """ Represents a lema for a simple entry.
     """
-    PROCESSING_TAGS = {
-        'lema': {
+    __slots__ = ('_id', '_is_foreign', '_lema')
+    PROCESSING_TAGS = MappingProxyType({
+        'lema': MappingProxyType({
             'tag': 'p',
             'class': 'k'
-        }
-    }
+        })
+    })
+    _PARSE_ONLY = SoupStrainer(name=PROCESSING_TAGS['lema']['tag'])
 
-    def __init__(self, html: str):
+    def __init__(self, html: str = '',
+                 tag: Optional[Tag] = None):
         """ Initializes a new instance of the EntryLema class.
 
         :param html: HTML code that contains a lema entry.
+        :param tag: An already parsed tag that contains a lema entry.
         """
-        super().__init__(html=html)
+        super().__init__(html=html, tag=tag)
 
     def __repr__(self):
         """ Gets the string representation of the object instance.
@@ -635,13 +794,16 @@ class EntryLema(FromHTML):
 
         :param extended: Flag indicating whether extended or basic information is output in the dictionary.
         """
+        if not extended:
+            return {
+                'lema': self._lema
+            }
         res_dict = super().to_dict(extended=extended)
-        res_dict['lema'] = self._lema
-        if extended:
-            res_dict.update({
-                'id': self._id,
-                'is_foreign': self._is_foreign
-            })
+        res_dict.update({
+            'lema': self._lema,
+            'id': self._id,
+            'is_foreign': self._is_foreign
+        })
         return res_dict
 
     def _parse_html(self):
@@ -651,11 +813,12 @@ class EntryLema(FromHTML):
         if self._parsed:
             return
         self._reset()
-        tag = self._soup.find(name=self.PROCESSING_TAGS['lema']['tag'])
-        if not tag or not tag.has_attr('class') or tag['class'][0].lower()[0] != self.PROCESSING_TAGS['lema']['class']:
+        lema_tags = self.PROCESSING_TAGS['lema']
+        tag = self._find_tag(name=lema_tags['tag'])
+        classes = tag.attrs.get('class') if tag else None
+        if not classes or classes[0].lower()[0] != lema_tags['class']:
             raise Exception('Invalid HTML.')
-        if tag.has_attr('id'):
-            self._id = tag['id']
+        self._id = tag.attrs.get('id', '')
         self._lema = tag.get_text()
         self._is_foreign = tag.find(name='i') is not None
         self._parsed = True
@@ -668,41 +831,95 @@ class EntryLema(FromHTML):
         self._lema: str = ''
 
 
+def _process_entry_tags(tags: Sequence[Tag],
+                        lema_class: type,
+                        processing_tags: Mapping) -> Tuple[Optional[EntryLema], List[Sentence], List[Definition]]:
+    """ Processes the tags that make up an entry. Kept out of the Entry class so that the C types declared in core.pxd
+    apply when the module is compiled with Cython.
+
+    :param tags: The tags that make up the entry.
+    :param lema_class: The class used to parse the lema of the entry.
+    :param processing_tags: The names and class letters of the tags that make up the entry.
+    :return: A tuple with the lema, the supplementary information and the definitions of the entry.
+    """
+    lema = None
+    supplementary_info = []
+    definitions = []
+    supplementary_info_tag = processing_tags['supplementary_info']
+    definition_tag = processing_tags['definition']
+    for tag in tags:
+        if not lema:
+            lema = lema_class.from_tag(tag=tag)
+            if lema:
+                continue
+        name = tag.name
+        classes = tag.attrs.get('class')
+        class_letter = classes[0].lower()[0] if classes else ''
+        if name == supplementary_info_tag['tag'] and class_letter == supplementary_info_tag['class']:
+            supplementary_info.append(Sentence(tag=tag))
+        elif name == definition_tag['tag'] and class_letter == definition_tag['class']:
+            definitions.append(Definition(tag=tag))
+    return lema, supplementary_info, definitions
+
+
 class Entry(FromHTML):
     """ Represents an entry, which is a full group of definitions for a word or word combination.
     """
+    __slots__ = ('_definitions', '_lema', '_supplementary_info', '_tags')
     _LEMA_CLASS = EntryLema
-    PROCESSING_TAGS = {
-        'supplementary_info': {
+    PROCESSING_TAGS = MappingProxyType({
+        'supplementary_info': MappingProxyType({
             'tag': 'p',
             'class': 'n'
-        },
-        'definition': {
+        }),
+        'definition': MappingProxyType({
             'tag': 'p',
             'class': 'm'
-        }
-    }
+        })
+    })
 
-    def __init__(self, html: str):
+    def __init__(self, html: str = '',
+                 tag: Optional[Tag] = None,
+                 tags: Optional[Sequence[Tag]] = None):
         """ Initializes a new instance of the Entry class.
 
         :param html: HTML code that contains a simple entry.
+        :param tag: An already parsed tag that contains a simple entry.
+        :param tags: Already parsed sibling tags that make up a simple entry without a tag of its own.
+        """
+        self._tags: Optional[Sequence[Tag]] = tags
+        if tags is None:
+            super().__init__(html=html, tag=tag)
+            return
+        # The HTML text of an entry made of sibling tags is only rendered on demand.
+        self._html: Optional[str] = None
+        self._parsed: bool = False
+        self._soup: Optional[Tag] = None
+        self._parse_html()
+
+    def __getstate__(self) -> dict:
+        """ Gets a dictionary with attributes that are pickable.
+
+        :return: A dictionary with attributes that are pickable.
         """
-        super().__init__(html=html)
+        state = super().__getstate__()
+        # The sibling tags are kept in the HTML text, which is parsed again when unpickling.
+        state['_tags'] = None
+        return state
 
     def __repr__(self):
         """ Gets the string representation of the object instance.
 
         :return: The string representation of the object instance.
         """
-        return f'Entry(lema="{self.lema.lema}", raw_text="{self._raw_text}")'
+        return f'Entry(lema="{self.lema.lema}", raw_text="{self.raw_text}")'
 
     def __str__(self):
         """ Gets the string representation of the object instance.
 
         :return: The string representation of the object instance.
         """
-        return self._raw_text
+        return self.raw_text
 
     @property
     def definitions(self) -> List[Definition]:
@@ -720,6 +937,9 @@ class Entry(FromHTML):
     def raw_text(self) -> str:
         """ Gets the raw text of the whole HTML used for the Article.
         """
+        if self._raw_text is None:
+            self._raw_text = (''.join(tag.get_text() for tag in self._tags) if self._soup is None
+                              else self._soup.get_text())
         return self._raw_text
 
     @property
@@ -733,50 +953,58 @@ class Entry(FromHTML):
 
         :param extended: Flag indicating whether extended or basic information is output in the dictionary.
         """
+        if not extended:
+            return {
+                'lema': self.lema.to_dict(extended=extended),
+                'supplementary_info': [s.to_dict(extended=extended) for s in self._supplementary_info],
+                'definitions': [definition.to_dict(extended=extended) for definition in self._definitions]
+            }
         res_dict = super().to_dict(extended=extended)
         res_dict.update({
             'lema': self.lema.to_dict(extended=extended),
             'supplementary_info': [s.to_dict(extended=extended) for s in self._supplementary_info],
-            'definitions': [definition.to_dict(extended=extended) for definition in self._definitions]
+            'definitions': [definition.to_dict(extended=extended) for definition in self._definitions],
+            'raw_text': self.raw_text
         })
-        if extended:
-            res_dict['raw_text'] = self._raw_text
         return res_dict
 
     def _parse_html(self):
         """ Parses the contents of the HTML.
         """
+        if self._tags is not None and self._html is None:
+            if not self._parsed:
+                self._reset()
+                self._process_entry(tags=self._tags)
+                self._parsed = True
+            return
+        self._tags = None
         super()._parse_html()
         if self._parsed:
             return
         self._reset()
-        self._process_entry(entry_tag=self._soup.contents[0])
+        entry_tag = self._root_tag()
+        if entry_tag:
+            self._process_entry(tags=entry_tag.find_all(True, recursive=False))
         self._parsed = True
 
-    def _process_entry(self, entry_tag: Tag):
+    def _process_entry(self, tags: Sequence[Tag]):
         """ Processes the whole entry.
 
-        :param entry_tag: A tag instance.
+        :param tags: The tags that make up the entry.
         """
-        if not entry_tag:
-            return
-        for tag in entry_tag.children:
-            if not isinstance(tag, Tag):
-                continue
-            if not self._lema:
-                self._lema = self._LEMA_CLASS.from_html(html=str(tag))
-                if self._lema:
-                    continue
-            class_letter = tag['class'][0].lower()[0] if tag.has_attr('class') else ''
-            if (tag.name == self.PROCESSING_TAGS['supplementary_info']['tag']
-                    and class_letter == self.PROCESSING_TAGS['supplementary_info']['class']):
-                self._supplementary_info.append(Sentence(html=str(tag)))
-            elif (tag.name == self.PROCESSING_TAGS['definition']['tag']
-                    and class_letter == self.PROCESSING_TAGS['definition']['class']):
-                self._definitions.append(Definition(html=str(tag)))
+        self._lema, self._supplementary_info, self._definitions = _process_entry_tags(
+            tags=tags, lema_class=self._LEMA_CLASS, processing_tags=self.PROCESSING_TAGS)
         if not self._lema:
             raise Exception('Could not process lema from the given HTML.')
-        self._raw_text = self._soup.get_text()
+
+    def _render_html(self) -> str:
+        """ Renders the HTML text of an instance created from already parsed tags.
+
+        :return: The HTML text, with the sibling tags of an entry wrapped in a <div> element.
+        """
+        if self._soup is None:
+            return f"<div>{''.join(str(tag) for tag in self._tags)}</div>"
+        return super()._render_html()
 
     def _reset(self):
         """ Resets fields to a clean state. Needed when resetting the HTML text.
@@ -784,25 +1012,32 @@ class Entry(FromHTML):
         self._lema: Optional[EntryLema] = None
         self._supplementary_info: List[Sentence] = []
         self._definitions: List[Definition] = []
-        self._raw_text: str = ''
+        self._raw_text: Optional[str] = None
 
 
 class ArticleLema(EntryLema):
     """ Represents a lema for an article.
     """
+    __slots__ = ('_female_suffix', '_index')
     LEMA_REGEX_STRING = r'^(?P<lema>[^\W\d_]+)(?P<index>\d+)?(?:,\s+(?P<female_suffix>\w+))?(?:\s+\((' \
                         r'?P<related>\w+)\))?$'
     lema_re = re.compile(pattern=LEMA_REGEX_STRING, flags=re.IGNORECASE)
-    PROCESSING_TAGS = deepcopy(EntryLema.PROCESSING_TAGS)
-    PROCESSING_TAGS['lema']['tag'] = 'header'
-    PROCESSING_TAGS['lema']['class'] = 'f'
+    PROCESSING_TAGS = MappingProxyType({
+        'lema': MappingProxyType({
+            'tag': 'header',
+            'class': 'f'
+        })
+    })
+    _PARSE_ONLY = SoupStrainer(name=PROCESSING_TAGS['lema']['tag'])
 
-    def __init__(self, html: str):
+    def __init__(self, html: str = '',
+                 tag: Optional[Tag] = None):
         """ Initializes a new instance of the ArticleLema class.
 
         :param html: HTML code that contains an a lema for an article.
+        :param tag: An already parsed tag that contains a lema for an article.
         """
-        super().__init__(html=html)
+        super().__init__(html=html, tag=tag)
 
     @property
     def female_suffix(self) -> str:
@@ -859,7 +1094,7 @@ class ArticleLema(EntryLema):
         if self._parsed:
             return
         self._reset()
-        match = self.lema_re.match(string=self._lema)
+        match = _match_lema(text=self._lema)
         if match:
             self._lema = match['lema']
             if match['index']:
@@ -876,11 +1111,23 @@ class ArticleLema(EntryLema):
         self._female_suffix: str = ''
 
 
-class Conjugation(FromHTML):
-    """ Represents the conjugation table for a verb.
+@lru_cache(maxsize=4096)
+def _match_lema(text: str) -> Optional[Match]:
+    """ Matches a text against the lema regular expression, remembering the result for recurring texts.
+
+    :param text: The text to match.
+    :return: The match of the lema regular expression, or None if the text does not match.
+    """
+    return ArticleLema.lema_re.match(string=text)
+
+
+def _new_conjugation_dict() -> dict:
+    """ Creates the base dictionary that holds the conjugations of a verb.
+
+    :return: A new dictionary with the empty structure of the conjugations.
     """
     # noinspection SpellCheckingInspection
-    CONJUGATION_BASE_DICT = {
+    return {
         'Formas no personales': {
             'Infinitivo': '',
             'Gerundio': '',
@@ -901,12 +1148,33 @@ class Conjugation(FromHTML):
         'Imperativo': {}
     }
 
-    def __init__(self, html: str):
+
+class Conjugation(FromHTML):
+    """ Represents the conjugation table for a verb.
+    """
+    __slots__ = ('_conjugations', '_id', '_verb')
+    # noinspection SpellCheckingInspection
+    _PARSE_ONLY = SoupStrainer(name='div', attrs={'id': 'conjugacion'})
+    # Separators between alternative forms of a verb, 'o' becomes 'u' before verbs starting with 'o'.
+    __verb_separators_re = re.compile(pattern=' o | / ')
+    __o_verb_separators_re = re.compile(pattern=' u | / ')
+    # Patterns that identify the sub type of a conjugation from the text of a header, grouped by type.
+    __sub_type_res = {type_key: {sub_type_key: re.compile(pattern=(sub_type_key
+                                                                   if sub_type_key in ('Presente', 'Infinitivo',
+                                                                                       'Gerundio', 'Participio')
+                                                                   else f'/ {re.escape(sub_type_key)}'),
+                                                          flags=re.IGNORECASE)
+                                 for sub_type_key in sub_types}
+                      for type_key, sub_types in _new_conjugation_dict().items()}
+
+    def __init__(self, html: str = '',
+                 tag: Optional[Tag] = None):
         """ Initializes a new instance of the Conjugation class.
 
         :param html: HTML code that contains the table of a conjugation.
+        :param tag: An already parsed tag that contains the table of a conjugation.
         """
-        super().__init__(html=html)
+        super().__init__(html=html, tag=tag)
 
     def __repr__(self):
         """ Gets the string representation of the object instance.
@@ -962,58 +1230,36 @@ class Conjugation(FromHTML):
             return
         self._reset()
         # noinspection SpellCheckingInspection
-        if not self._soup.div or not self._soup.div.has_attr('id') or self._soup.div['id'] != 'conjugacion':
+        div_tag = self._find_tag(name='div')
+        if not div_tag or div_tag.attrs.get('id') != 'conjugacion':
             raise Exception('Invalid HTML for a conjugations table.')
-        id_tag = self._soup.div.find(name='article')
-        if id_tag and id_tag.has_attr('id'):
+        id_tag = div_tag.find(name='article')
+        article_id = id_tag.attrs.get('id') if id_tag else None
+        if article_id is not None:
             # noinspection SpellCheckingInspection
-            self._id = f"conjugacion{id_tag['id']}"
-        header_tag = self._soup.div.find(name='header')
+            self._id = f'conjugacion{article_id}'
+        header_tag = div_tag.find(name='header')
         if header_tag:
             verb_tag = header_tag.find(name='b')
             if verb_tag:
                 self._verb = verb_tag.text
-        table_tag = self._soup.div.find(name='table', class_='cnj')
+        table_tag = div_tag.find(name='table', class_='cnj')
         if table_tag:
-            self._conjugations = deepcopy(self.CONJUGATION_BASE_DICT)
-            sub_type_keys_dict = {}
-            verb_separators = (' u ' if self._verb.startswith('o') else ' o ', ' / ')
-            type_key = ''
-            conjugation_keys_no_slash = ('Presente', 'Infinitivo', 'Gerundio', 'Participio')
+            self._conjugations = _new_conjugation_dict()
+            verb_separators_re = (self.__o_verb_separators_re if self._verb.startswith('o')
+                                  else self.__verb_separators_re)
+            rows = []
             for row_tag in table_tag.children:
-                for cell_index, cell_tag in enumerate(row_tag.contents):
-                    if cell_index < 3:
-                        continue
-                    if cell_tag.name == 'th':
-                        header_text = cell_tag.get_text()
-                        if header_text in self._conjugations.keys():
-                            type_key = header_text
-                            sub_type_keys_dict = {}
-                            continue
-                        # noinspection SpellCheckingInspection
-                        sub_type_key = next((key for key in self._conjugations[type_key].keys()
-                                             if re.search(pattern=(f'/ {key}'
-                                                                   if key not in conjugation_keys_no_slash
-                                                                   else key),
-                                                          string=header_text,
-                                                          flags=re.IGNORECASE)), '')
-                        sub_type_keys_dict[cell_index] = sub_type_key
-                        continue
-                    if cell_tag.name == 'td':
-                        persona_tag: Optional[Tag] = row_tag.contents[2] if cell_index >= 3 else None
-                        persona = str(persona_tag.string) if persona_tag and persona_tag.string is not None else ''
-                        keys = [type_key]
-                        if sub_type_keys_dict:
-                            keys.append(sub_type_keys_dict[cell_index])
-                        verbs = cell_tag.get_text()
-                        for verb_separator in verb_separators:
-                            if verb_separator in verbs:
-                                verbs = verbs.split(verb_separator)
-                                if len(verbs) == 1:
-                                    verbs = verbs[0]
-                                break
-                        data_value = {persona: verbs} if persona else verbs
-                        nested_dictionary_set(dictionary=self._conjugations, keys=keys, value=data_value)
+                cell_tags = row_tag.contents
+                if len(cell_tags) <= 3:
+                    continue
+                # The third cell of a row holds the persona of the conjugations in the cells that follow it.
+                persona_string = cell_tags[2].string
+                persona = str(persona_string) if persona_string is not None else ''
+                rows.append((persona, [(cell_tag.name, cell_tag.get_text() if cell_tag.name in ('th', 'td') else '')
+                                       for cell_tag in cell_tags[3:]]))
+            fill_conjugations(conjugations=self._conjugations, rows=rows, sub_type_res=self.__sub_type_res,
+                              verb_separators_re=verb_separators_re)
         self._parsed = True
 
     def _reset(self):
@@ -1027,20 +1273,36 @@ class Conjugation(FromHTML):
 class Article(Entry):
     """ Represents an article, which contains simple entries and complex forms.
     """
+    __slots__ = ('_complex_forms', '_conjugations', '_id', '_is_verb', '_other_entries')
     _LEMA_CLASS = ArticleLema
-    PROCESSING_TAGS = deepcopy(Entry.PROCESSING_TAGS)
-    PROCESSING_TAGS['definition']['class'] = 'j'
-    PROCESSING_TAGS['other'] = {
-        'tag': 'p',
-        'class': 'l'
-    }
-
-    def __init__(self, html: str):
+    PROCESSING_TAGS = MappingProxyType({
+        **Entry.PROCESSING_TAGS,
+        'definition': MappingProxyType({
+            **Entry.PROCESSING_TAGS['definition'],
+            'class': 'j'
+        }),
+        'other': MappingProxyType({
+            'tag': 'p',
+            'class': 'l'
+        })
+    })
+    _PARSE_ONLY = SoupStrainer(name='article')
+    # The tag name and class letters used to group the children of an article, resolved once for the class.
+    _LEMA_TAG = ArticleLema.PROCESSING_TAGS['lema']['tag']
+    _DEFINITION_CLASS = PROCESSING_TAGS['definition']['class']
+    _SUPPLEMENTARY_INFO_CLASS = PROCESSING_TAGS['supplementary_info']['class']
+    _OTHER_CLASS = PROCESSING_TAGS['other']['class']
+    _COMPLEX_FORM_LEMA_CLASS = EntryLema.PROCESSING_TAGS['lema']['class']
+    _COMPLEX_FORM_DEFINITION_CLASS = Entry.PROCESSING_TAGS['definition']['class']
+
+    def __init__(self, html: str = '',
+                 tag: Optional[Tag] = None):
         """ Initializes a new instance of the Article class.
 
         :param html: HTML code that contains a definition.
+        :param tag: An already parsed tag that contains an article.
         """
-        super().__init__(html=html)
+        super().__init__(html=html, tag=tag)
 
     def __repr__(self):
         """ Gets the string representation of the object instance.
@@ -1062,6 +1324,21 @@ class Article(Entry):
         """
         return self._complex_forms
 
+    @property
+    def conjugations(self) -> Optional[Conjugation]:
+        """ Gets the conjugations of the verb of the article, if any.
+        """
+        return self._conjugations
+
+    @conjugations.setter
+    def conjugations(self, value: Optional[Conjugation]):
+        """ Sets the conjugations of the verb of the article.
+
+        :param value: The conjugations of the verb, or None.
+        """
+        self._conjugations = value
+        self._is_verb = None
+
     @property
     def id(self) -> str:
         """ Gets the ID of the article.
@@ -1072,8 +1349,10 @@ class Article(Entry):
     def is_verb(self) -> bool:
         """ Gets a value indicating whether the article has conjugations or an entry that is a verb.
         """
-        return self.conjugations is not None or any(definition for definition in self.definitions
-                                                    if definition.is_verb)
+        if self._is_verb is None:
+            self._is_verb = (self._conjugations is not None
+                             or any(definition.is_verb for definition in self._definitions))
+        return self._is_verb
 
     @property
     def lema(self) -> ArticleLema:
@@ -1104,8 +1383,8 @@ class Article(Entry):
             'complex_forms': [complex_form.to_dict(extended=extended) for complex_form in self._complex_forms],
             'other_entries': [entry.to_dict(extended=extended) for entry in self._other_entries]
         })
-        if self.conjugations:
-            res_dict['conjugations'] = self.conjugations.to_dict(extended=extended)
+        if self._conjugations:
+            res_dict['conjugations'] = self._conjugations.to_dict(extended=extended)
         if extended:
             res_dict['raw_text'] = self._raw_text
         return res_dict
@@ -1117,38 +1396,37 @@ class Article(Entry):
         if self._parsed:
             return
         self._reset()
-        if not self._soup.article or not self._soup.article.header:
+        article_tag = self._find_tag(name='article')
+        if not article_tag or not article_tag.header:
             raise Exception('Invalid HTML.')
         self._raw_text = self._soup.get_text()
-        if self._soup.article.has_attr('id'):
-            self._id = self._soup.article['id']
-        lema_entry_tag = Tag(name='lema_entry')
-        complex_form_tag: Optional[Tag] = None
-        complex_forms_tags: List[Tag] = []
-        for tag in self._soup.article.children:
-            if tag.name == ArticleLema.PROCESSING_TAGS['lema']['tag']:
-                lema_entry_tag.append(tag)
+        self._id = article_tag.attrs.get('id', '')
+        # The children are grouped without moving them, so the parsed tree is left untouched.
+        lema_entry_tags: List[Tag] = []
+        complex_form_tags: Optional[List[Tag]] = None
+        complex_forms_tags: List[List[Tag]] = []
+        for tag in article_tag.children:
+            if tag.name == self._LEMA_TAG:
+                lema_entry_tags.append(tag)
             elif tag.name == 'p':
-                class_letter = tag['class'][0].lower()[0]
-                if class_letter == self.PROCESSING_TAGS['definition']['class']:
-                    lema_entry_tag.append(tag)
-                elif class_letter == EntryLema.PROCESSING_TAGS['lema']['class']:
-                    complex_form_tag = Tag(name='complex_form_entry')
-                    complex_forms_tags.append(complex_form_tag)
-                    complex_form_tag.append(tag)
-                elif class_letter == self.PROCESSING_TAGS['supplementary_info']['class']:
-                    if complex_form_tag is not None:
-                        complex_form_tag.append(tag)
+                classes = tag.attrs.get('class')
+                class_letter = classes[0].lower()[0] if classes else ''
+                if class_letter == self._DEFINITION_CLASS:
+                    lema_entry_tags.append(tag)
+                elif class_letter == self._COMPLEX_FORM_LEMA_CLASS:
+                    complex_form_tags = [tag]
+                    complex_forms_tags.append(complex_form_tags)
+                elif class_letter == self._SUPPLEMENTARY_INFO_CLASS:
+                    if complex_form_tags is not None:
+                        complex_form_tags.append(tag)
                     else:
-                        lema_entry_tag.append(tag)
-                elif (class_letter == super().PROCESSING_TAGS['supplementary_info']['class']
-                      or class_letter == super().PROCESSING_TAGS['definition']['class']):
-                    complex_form_tag.append(tag)
-                elif class_letter == self.PROCESSING_TAGS['other']['class']:
-                    self._other_entries.append(Word(html=str(tag), parent_href=self._id))
-        self._process_entry(entry_tag=lema_entry_tag)
-        for complex_form_tag in complex_forms_tags:
-            self._complex_forms.append(Entry(html=str(complex_form_tag)))
+                        lema_entry_tags.append(tag)
+                elif class_letter == self._COMPLEX_FORM_DEFINITION_CLASS:
+                    complex_form_tags.append(tag)
+                elif class_letter == self._OTHER_CLASS:
+                    self._other_entries.append(Word(parent_href=self._id, tag=tag))
+        self._process_entry(tags=lema_entry_tags)
+        self._complex_forms = [Entry(tags=complex_form_tags) for complex_form_tags in complex_forms_tags]
         self._parsed = True
 
     def _reset(self):
@@ -1159,21 +1437,27 @@ class Article(Entry):
         self._lema: Optional[ArticleLema] = None
         self._complex_forms: List[Entry] = []
         self._other_entries: List[Word] = []
-        self.conjugations: Optional[Conjugation] = None
+        self._conjugations: Optional[Conjugation] = None
+        self._is_verb: Optional[bool] = None
 
 
 class SearchResult(FromHTML):
     """ Represents the result of a search.
     """
+    __slots__ = ('_articles', '_canonical', '_meta_description', '_related_entries', '_title')
     __INDEX_REGEX_STRING = r'^(?P<lema>\D*)(?P<index>\d+)$'
-    __index_re = re.compile(pattern=__INDEX_REGEX_STRING, flags=re.IGNORECASE)
+    __index_re = re.compile(pattern=__INDEX_REGEX_STRING)
+    # Only the tags that hold the metadata and the results are needed, the rest of the page is skipped.
+    _PARSE_ONLY = SoupStrainer(name=['div', 'link', 'meta', 'title'])
 
-    def __init__(self, html: str):
+    def __init__(self, html: str = '',
+                 tag: Optional[Tag] = None):
         """ Initializes a new instance of the SearchResult class.
 
         :param html: HTML code that contains a definition.
+        :param tag: An already parsed tag that contains a search result.
         """
-        super().__init__(html=html)
+        super().__init__(html=html, tag=tag)
 
     def __repr__(self):
         """ Gets the string representation of the object instance.
@@ -1257,26 +1541,31 @@ class SearchResult(FromHTML):
         # noinspection SpellCheckingInspection
         results_div_tag = self._soup.find(name='div', attrs={'id': 'resultados'})
         if results_div_tag:
-            for article_tag in results_div_tag.find_all(name='article', recursive=False):
-                article = Article(html=str(article_tag))
-                self._articles.append(article)
-                # noinspection SpellCheckingInspection
-                conjugations_tag = article_tag.find_next_sibling(name='div', attrs={'id': 'conjugacion'})
-                if conjugations_tag:
-                    conjugations = Conjugation(html=str(conjugations_tag))
-                    a_tag = article_tag.find(name='a', class_=re.compile('^e'))
-                    if a_tag and a_tag.has_attr('href') and a_tag['href'] == f'#{conjugations.id}':
-                        article.conjugations = conjugations
+            article_tags = results_div_tag.find_all(name='article', recursive=False)
+            self._articles = [Article(tag=article_tag) for article_tag in article_tags]
+            # The conjugations are indexed by the anchor that links them from their article.
+            conjugations_by_href = {}
+            # noinspection SpellCheckingInspection
+            for conjugations_tag in results_div_tag.find_all(name='div', attrs={'id': 'conjugacion'},
+                                                             recursive=False):
+                conjugations = Conjugation(tag=conjugations_tag)
+                conjugations_by_href[f'#{conjugations.id}'] = conjugations
+            if conjugations_by_href:
+                for article_tag, article in zip(article_tags, self._articles):
+                    a_tag = article_tag.find(name='a',
+                                             class_=lambda class_name: class_name and class_name.startswith('e'))
+                    if a_tag:
+                        article.conjugations = conjugations_by_href.get(a_tag.attrs.get('href'))
             for related_res in results_div_tag.find_all(name='div', class_='n1', recursive=False):
                 if not related_res.a:
                     continue
-                match = ArticleLema.lema_re.match(related_res.get_text())
+                match = _match_lema(text=related_res.get_text())
                 if not match:
                     continue
                 if match['related'] in self._related_entries:
-                    self._related_entries[match['related']].append(Word(html=str(related_res.a)))
+                    self._related_entries[match['related']].append(Word(tag=related_res.a))
                 else:
-                    self._related_entries[match['related']] = [Word(html=str(related_res.a))]
+                    self._related_entries[match['related']] = [Word(tag=related_res.a)]
         self._parsed = True
 
     def _reset(self):
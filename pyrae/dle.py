@@ -1,16 +1,17 @@
+import urllib3
 from dogpile.cache import make_region
 from pyrae import core
 from pyrae import logger
-from sys import version_info
 from typing import Optional
-from urllib.error import URLError, HTTPError
 from urllib.parse import quote
-from urllib.request import Request, urlopen
 
 cache_region = make_region().configure('dogpile.cache.memory', expiration_time=86400)
+# Keeps the connections to the RAE open between searches, the responses are requested compressed.
+http_pool = urllib3.PoolManager(headers=urllib3.make_headers(accept_encoding='gzip', user_agent='Mozilla/5.0'))
 
 
-@cache_region.cache_on_arguments()
+# Failed searches return None and are not cached, so they are retried on the next call.
+@cache_region.cache_on_arguments(should_cache_fn=lambda result: result is not None)
 def search_by_url(url: str) -> Optional[core.SearchResult]:
     """ Performs a search given the full URL to the RAE.
 
@@ -26,16 +27,15 @@ def search_by_url(url: str) -> Optional[core.SearchResult]:
         return None
     logger.current.info(f"Performing request to: '{url}'...")
     try:
-        with urlopen(Request(url=url, headers={'User-Agent': 'Mozilla/5.0'})) as response:
-            status_code = response.status if version_info >= (3, 9, 0) else response.code
-            logger.current.debug(f'Received response with OK status code {status_code}.')
-            result = core.SearchResult(html=response.read())
-            return result
-    except HTTPError as e:
-        logger.current.error(f'The server could not fulfill the request. Error code: {e.code}.')
-        return None
-    except URLError as e:
-        logger.current.error(f'Failed to reach a server. Reason: {e.reason}')
+        response = http_pool.request(method='GET', url=url)
+        if response.status >= 400:
+            logger.current.error(f'The server could not fulfill the request. Error code: {response.status}.')
+            return None
+        logger.current.debug(f'Received response with OK status code {response.status}.')
+        result = core.SearchResult(html=response.data)
+        return result
+    except urllib3.exceptions.HTTPError as e:
+        logger.current.error(f'Failed to reach a server. Reason: {e}')
         return None
     except Exception as e:
         logger.current.error(f'Unexpected error. str{e}')
@@ -48,6 +48,8 @@ def search_by_word(word: str) -> Optional[core.SearchResult]:
     :param word: A word or term to search for.
     :return: A SearchResult instance, or None if an error occurs.
     """
+    # Surrounding whitespace does not change the search, removing it avoids caching the same result twice.
+    word = word.strip() if word else word
     if not word:
         logger.current.error('No word was specified.')
         return None
@@ -1,5 +1,8 @@
 from typing import Any, Sequence
 
+# Marks a missing key, so that keys holding None are told apart from missing ones.
+_MISSING = object()
+
 
 def nested_dictionary_set(dictionary: dict,
                           keys: Sequence,
@@ -17,18 +20,23 @@ def nested_dictionary_set(dictionary: dict,
     :return: The modified dictionary reference.
     """
     d = dictionary
-    for key in keys[:-1]:
-        if key in d:
-            d = d[key]
+    last_index = len(keys) - 1
+    for index in range(last_index):
+        key = keys[index]
+        child = d.get(key, _MISSING)
+        if child is not _MISSING:
+            d = child
         elif create_missing:
             d = d.setdefault(key, {})
         else:
             return dictionary
-    if keys[-1] in d:
-        if isinstance(d[keys[-1]], dict) and isinstance(value, dict) and update_if_dicts:
-            d[keys[-1]].update(value)
+    last_key = keys[last_index]
+    existing = d.get(last_key, _MISSING)
+    if existing is not _MISSING:
+        if update_if_dicts and isinstance(existing, dict) and isinstance(value, dict):
+            existing.update(value)
         else:
-            d[keys[-1]] = value
+            d[last_key] = value
     elif create_missing:
-        d[keys[-1]] = value
+        d[last_key] = value
     return dictionary
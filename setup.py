@@ -1,9 +1,41 @@
 import setuptools
 from pyrae import __version__
+from setuptools.command.build_ext import build_ext
+
+try:
+    from setuptools.errors import CCompilerError, ExecError, PlatformError
+except ImportError:
+    # setuptools < 59 does not expose the distutils errors
+    from distutils.errors import CCompilerError, DistutilsExecError as ExecError, \
+        DistutilsPlatformError as PlatformError
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
 
 with open("README.md", "r") as fh:
     long_description = fh.read()
 
+
+class OptionalBuildExt(build_ext):
+    """ Builds the compiled modules, falling back to the pure Python ones when they cannot be built.
+    """
+    def run(self):
+        try:
+            super().run()
+        except PlatformError as e:
+            print(f'WARNING: Compiled modules could not be built, using pure Python modules instead. {e}')
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except (CCompilerError, ExecError, PlatformError) as e:
+            print(f"WARNING: The '{ext.name}' module could not be compiled, using the pure Python module instead. {e}")
+            # Leave it out of the build outputs so it is not copied or installed.
+            self.extensions = [extension for extension in self.extensions if extension is not ext]
+
+
 setuptools.setup(
     name="pyrae",
     version=__version__,
@@ -12,13 +44,22 @@ setuptools.setup(
     description="Perform searches against the RAE dictionary.",
     install_requires=[
         'beautifulsoup4',
-        'dogpile.cache'
+        'dogpile.cache',
+        'lxml',
+        'urllib3'
     ],
     license='MIT',
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/nachocho/pyrae",
     packages=setuptools.find_packages(),
+    # The Cython declarations are needed to compile the modules from a source distribution.
+    package_data={'pyrae': ['*.pxd']},
+    # The parsing modules are compiled with Cython when available, the pure Python modules are used otherwise.
+    # Type annotations are not enforced, they document the API but some callers pass bytes as HTML.
+    ext_modules=cythonize(['pyrae/_fastparse.py', 'pyrae/core.py'],
+                          compiler_directives={'language_level': 3, 'annotation_typing': False}) if cythonize else [],
+    cmdclass={'build_ext': OptionalBuildExt},
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Programming Language :: Python :: 3.6",